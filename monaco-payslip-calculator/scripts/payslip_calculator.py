@@ -12,9 +12,94 @@ Usage:
 
 import argparse
 import json
-from decimal import Decimal, ROUND_HALF_UP
-from typing import Dict, Any, Optional, Tuple
+from decimal import Decimal
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Sequence, Tuple, Union
 from datetime import datetime
+from functools import lru_cache
+
+# NumPy is only needed for bulk payroll runs (calculate_batch, calculate_many) and
+# is imported inside them, so single-payslip CLI calls never load it
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _round_half_up_div(numerator: int, denominator: int) -> int:
+    """
+    Integer division rounded half away from zero (same as ROUND_HALF_UP).
+
+    Args:
+        numerator: Scaled amount to divide
+        denominator: Positive scale factor
+
+    Returns:
+        Rounded quotient
+    """
+    q, r = divmod(abs(numerator), denominator)
+    if 2 * r >= denominator:
+        q += 1
+    return q if numerator >= 0 else -q
+
+
+def _cents_to_decimal(cents: int) -> Decimal:
+    """Convert integer cents to a EUR Decimal with two decimal places."""
+    return Decimal(cents).scaleb(-2)
+
+
+def _cents_to_float(cents: int) -> float:
+    """Convert integer cents to EUR (true division gives the float nearest the exact amount)."""
+    return cents / 100
+
+
+def _percent_of(part_cents: int, whole_cents: int) -> float:
+    """
+    Express part as a percentage of whole, rounded half-even to 2 decimals.
+
+    Args:
+        part_cents: Amount in cents
+        whole_cents: Reference amount in cents
+
+    Returns:
+        Percentage (0.0 when whole is not positive)
+    """
+    if whole_cents <= 0:
+        return 0.0
+    # Percentage in hundredths of a percent
+    q, r = divmod(part_cents * 10000, whole_cents)
+    if 2 * r > whole_cents or (2 * r == whole_cents and q % 2):
+        q += 1
+    return q / 100
+
+
+def _round_half_up_div_array(numerator: 'np.ndarray', denominator: int) -> 'np.ndarray':
+    """Element-wise _round_half_up_div for int64 arrays (denominator must be even)."""
+    import numpy as np
+
+    return np.sign(numerator) * ((np.abs(numerator) + denominator // 2) // denominator)
+
+
+def _percent_of_array(part_cents: 'np.ndarray', whole_cents: 'np.ndarray') -> 'np.ndarray':
+    """Element-wise _percent_of for int64 arrays (same half-even integer rounding)."""
+    import numpy as np
+
+    positive = whole_cents > 0
+    safe_whole = np.where(positive, whole_cents, 1)
+    # Percentage in hundredths of a percent
+    q, r = np.divmod(part_cents * 10000, safe_whole)
+    q += (2 * r > safe_whole) | ((2 * r == safe_whole) & (q % 2 == 1))
+    return np.where(positive, q / 100, 0.0)
+
+
+# Payslip line labels per contribution category, one table per side since
+# the C.A.R. label shows the side-specific rate
+_EMPLOYEE_LABELS = {
+    'car_retirement': 'C.A.R. - Retraite (6,85%)',
+    'cmrc_supplementary_pension': 'CMRC - Retraite complémentaire',
+}
+_EMPLOYER_LABELS = {
+    'ccss_social_security': 'CCSS - Sécurité sociale (13,40%) *',
+    'car_retirement': 'C.A.R. - Retraite (8,33%)',
+    'cmrc_supplementary_pension': 'CMRC - Retraite complémentaire',
+}
 
 
 class MonacoPayslipCalculator:
@@ -56,45 +141,118 @@ class MonacoPayslipCalculator:
     RATES_EFFECTIVE_DATE = "2025-10-01"
     RATES_SOURCE = "Caisses Sociales de Monaco"
 
+    # Integer codes for employee types in vectorized payroll runs (calculate_many)
+    EMPLOYEE_TYPE_CODES = {'standard': 0, 'household': 1}
+
+    # Integer forms of the rates above, precomputed at class load. Amounts are
+    # integer cents and rates/percentages are basis points (13.40% = 1340 bp),
+    # so each contribution is one integer multiply and a half-up division
+    # with the same exact results as Decimal ROUND_HALF_UP.
+    _BP_SCALE = 10000  # 100% in basis points
+    _CONTRIBUTION_DIVISOR = _BP_SCALE * _BP_SCALE  # (cents * bp) * bp -> cents
+    _CCSS_RATE_BP = int(CCSS_RATE * 100)
+    _CCSS_HOUSEHOLD_BASE_BP = int(CCSS_HOUSEHOLD_BASE_PERCENTAGE * 100)
+    _CCSS_CEILING_CENTS = int(CCSS_MONTHLY_CEILING * 100)
+    _CAR_EMPLOYEE_RATE_BP = int(CAR_EMPLOYEE_RATE * 100)
+    _CAR_EMPLOYER_RATE_BP = int(CAR_EMPLOYER_RATE * 100)
+    _CAR_CEILING_CENTS = int(CAR_MONTHLY_CEILING * 100)
+    _CMRC_TRANCHE_A_CEILING_CENTS = int(CMRC_TRANCHE_A_CEILING * 100)
+    _CMRC_TRANCHE_A_RATE_BP = int(CMRC_TRANCHE_A_RATE_TOTAL * 100)
+    _CMRC_TRANCHE_A_EMPLOYEE_SHARE_BP = int(CMRC_TRANCHE_A_EMPLOYEE_PERCENT * 100)
+    _CMRC_TRANCHE_A_EMPLOYER_SHARE_BP = int(CMRC_TRANCHE_A_EMPLOYER_PERCENT * 100)
+    _CMRC_TRANCHE_B_RATE_BP = int(CMRC_TRANCHE_B_RATE_TOTAL * 100)
+    _CMRC_TRANCHE_B_EMPLOYEE_SHARE_BP = int(CMRC_TRANCHE_B_EMPLOYEE_PERCENT * 100)
+    _CMRC_TRANCHE_B_EMPLOYER_SHARE_BP = int(CMRC_TRANCHE_B_EMPLOYER_PERCENT * 100)
+    _CMRC_TRANCHE_B_SPAN_CENTS = int((CMRC_TRANCHE_B_MAX - CMRC_TRANCHE_A_CEILING) * 100)
+
+    # Flat-rate contributions per employee type, employee and employer sides in
+    # one table so a payslip is computed in a single pass. Each entry is
+    # (side, category, base_bp, rate_bp, scaled_ceiling) where the contribution
+    # is min(gross_cents * base_bp, scaled_ceiling) * rate_bp, with the ceiling
+    # pre-scaled to cents * _BP_SCALE.
+    # CMRC is tranche-based and handled separately by _calculate_cmrc_tranche.
+    _EMPLOYEE = 0
+    _EMPLOYER = 1
+    _CAR_EMPLOYEE_ENTRY = (_EMPLOYEE, 'car_retirement', _BP_SCALE, _CAR_EMPLOYEE_RATE_BP,
+                           _CAR_CEILING_CENTS * _BP_SCALE)
+    _CAR_EMPLOYER_ENTRY = (_EMPLOYER, 'car_retirement', _BP_SCALE, _CAR_EMPLOYER_RATE_BP,
+                           _CAR_CEILING_CENTS * _BP_SCALE)
+    _RATE_TABLES = {
+        'household': (
+            (_EMPLOYER, 'ccss_social_security', _CCSS_HOUSEHOLD_BASE_BP, _CCSS_RATE_BP,
+             _CCSS_CEILING_CENTS * _BP_SCALE),
+            _CAR_EMPLOYEE_ENTRY,
+            _CAR_EMPLOYER_ENTRY,
+        ),
+        'standard': (
+            (_EMPLOYER, 'ccss_social_security', _BP_SCALE, _CCSS_RATE_BP,
+             _CCSS_CEILING_CENTS * _BP_SCALE),
+            _CAR_EMPLOYEE_ENTRY,
+            _CAR_EMPLOYER_ENTRY,
+        ),
+    }
+
     def __init__(self, gross_salary: float, employee_type: str = 'household',
                  monthly_hours: Optional[float] = None):
         """
         Initialize the payslip calculator.
 
         Args:
-            gross_salary: Monthly gross salary in EUR
+            gross_salary: Monthly gross salary in EUR (at most two decimals)
             employee_type: 'household' (gens de maison) or 'standard'
             monthly_hours: Monthly hours worked (for household employees)
+
+        Raises:
+            ValueError: If gross_salary is not a whole number of cents or
+                employee_type is unknown
         """
         self.gross_salary = Decimal(str(gross_salary))
         self.employee_type = employee_type.lower()
         self.monthly_hours = Decimal(str(monthly_hours)) if monthly_hours else None
 
-        if self.employee_type not in ['household', 'standard']:
+        if self.employee_type not in self._RATE_TABLES:
             raise ValueError("employee_type must be 'household' or 'standard'")
 
-    def _calculate_contribution(self, rate: Decimal, base_salary: Decimal,
-                                ceiling: Optional[Decimal] = None) -> Decimal:
+        # Sub-cent amounts are rejected rather than rounded, so that gross, net and
+        # employer cost on the payslip always add up exactly
+        gross_cents = self.gross_salary * 100
+        if not gross_cents.is_finite() or gross_cents != gross_cents.to_integral_value():
+            raise ValueError("gross_salary must be a finite amount in whole cents (at most two decimals)")
+        self._gross_cents = int(gross_cents)
+
+    @classmethod
+    def _calculate_contribution(cls, rate_bp: int, base: int,
+                                ceiling: Optional[int] = None) -> int:
         """
         Calculate a single contribution amount.
 
         Args:
-            rate: Percentage rate (e.g., 13.40 for 13.40%)
-            base_salary: Salary to apply the rate to
-            ceiling: Maximum salary for this contribution (None = no ceiling)
+            rate_bp: Rate in basis points (e.g., 1340 for 13.40%)
+            base: Salary to apply the rate to, in cents * _BP_SCALE
+            ceiling: Maximum base for this contribution, same scale (None = no ceiling)
 
         Returns:
-            Contribution amount
+            Contribution amount in cents (rounded half-up)
         """
         # Apply ceiling if specified
-        if ceiling is not None:
-            base_salary = min(base_salary, ceiling)
+        if ceiling is not None and base > ceiling:
+            base = ceiling
+
+        return _round_half_up_div(base * rate_bp, cls._CONTRIBUTION_DIVISOR)
 
-        # Calculate contribution: base * (rate / 100)
-        contribution = base_salary * (rate / Decimal('100'))
+    @classmethod
+    def _ccss_base_scaled(cls, gross_cents: int, employee_type: str) -> int:
+        """CCSS contribution base in cents * _BP_SCALE, ceiling applied."""
+        if employee_type == 'household':
+            # For household employees, use 33% of gross salary as base
+            # (This applies to employers with 1-2 household employees, <254h/month)
+            base = gross_cents * cls._CCSS_HOUSEHOLD_BASE_BP
+        else:
+            # For standard employees, use full gross salary
+            base = gross_cents * cls._BP_SCALE
 
-        # Round to 2 decimal places (EUR cents)
-        return contribution.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        # Apply ceiling
+        return min(base, cls._CCSS_CEILING_CENTS * cls._BP_SCALE)
 
     def _get_ccss_base(self) -> Decimal:
         """
@@ -106,147 +264,416 @@ class MonacoPayslipCalculator:
         Returns:
             CCSS contribution base
         """
-        if self.employee_type == 'household':
-            # For household employees, use 33% of gross salary as base
-            # (This applies to employers with 1-2 household employees, <254h/month)
-            base = self.gross_salary * (self.CCSS_HOUSEHOLD_BASE_PERCENTAGE / Decimal('100'))
-        else:
-            # For standard employees, use full gross salary
-            base = self.gross_salary
+        return Decimal(self._ccss_base_scaled(self._gross_cents, self.employee_type)).scaleb(-6)
 
-        # Apply ceiling
-        base = min(base, self.CCSS_MONTHLY_CEILING)
-        return base
-
-    def _calculate_cmrc_tranche(self, salary: Decimal) -> Tuple[Decimal, Decimal]:
+    @classmethod
+    def _calculate_cmrc_tranche(cls, salary_cents: int) -> Tuple[int, int]:
         """
         Calculate CMRC (supplementary pension) contributions split by tranches.
 
         Returns:
-            Tuple of (employee_contribution, employer_contribution)
+            Tuple of (employee_contribution, employer_contribution) in cents
         """
-        employee_total = Decimal('0')
-        employer_total = Decimal('0')
-
         # Tranche A: up to €3,971
-        tranche_a_base = min(salary, self.CMRC_TRANCHE_A_CEILING)
-        if tranche_a_base > 0:
-            tranche_a_total = self._calculate_contribution(
-                self.CMRC_TRANCHE_A_RATE_TOTAL, tranche_a_base
-            )
-            employer_total += tranche_a_total * (self.CMRC_TRANCHE_A_EMPLOYER_PERCENT / Decimal('100'))
-            employee_total += tranche_a_total * (self.CMRC_TRANCHE_A_EMPLOYEE_PERCENT / Decimal('100'))
+        tranche_a_base = min(max(salary_cents, 0), cls._CMRC_TRANCHE_A_CEILING_CENTS)
+        tranche_a_total = cls._calculate_contribution(
+            cls._CMRC_TRANCHE_A_RATE_BP, tranche_a_base * cls._BP_SCALE
+        )
 
         # Tranche B: from €3,971 to 8x €3,971 (€31,768)
-        if salary > self.CMRC_TRANCHE_A_CEILING:
-            tranche_b_base = min(
-                salary - self.CMRC_TRANCHE_A_CEILING,
-                self.CMRC_TRANCHE_B_MAX - self.CMRC_TRANCHE_A_CEILING
-            )
-            if tranche_b_base > 0:
-                tranche_b_total = self._calculate_contribution(
-                    self.CMRC_TRANCHE_B_RATE_TOTAL, tranche_b_base
-                )
-                employer_total += tranche_b_total * (self.CMRC_TRANCHE_B_EMPLOYER_PERCENT / Decimal('100'))
-                employee_total += tranche_b_total * (self.CMRC_TRANCHE_B_EMPLOYEE_PERCENT / Decimal('100'))
-
-        # Round final amounts
-        employee_total = employee_total.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-        employer_total = employer_total.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        tranche_b_base = min(max(salary_cents - cls._CMRC_TRANCHE_A_CEILING_CENTS, 0),
+                             cls._CMRC_TRANCHE_B_SPAN_CENTS)
+        tranche_b_total = cls._calculate_contribution(
+            cls._CMRC_TRANCHE_B_RATE_BP, tranche_b_base * cls._BP_SCALE
+        )
+
+        # Split each tranche total, then round the combined shares
+        employee_total = _round_half_up_div(
+            tranche_a_total * cls._CMRC_TRANCHE_A_EMPLOYEE_SHARE_BP
+            + tranche_b_total * cls._CMRC_TRANCHE_B_EMPLOYEE_SHARE_BP,
+            cls._BP_SCALE
+        )
+        employer_total = _round_half_up_div(
+            tranche_a_total * cls._CMRC_TRANCHE_A_EMPLOYER_SHARE_BP
+            + tranche_b_total * cls._CMRC_TRANCHE_B_EMPLOYER_SHARE_BP,
+            cls._BP_SCALE
+        )
 
         return employee_total, employer_total
 
-    def calculate_employee_contributions(self) -> Dict[str, Decimal]:
+    @classmethod
+    def _calculate_contributions_cents(cls, gross_cents: int,
+                                       employee_type: str) -> Tuple[Dict[str, int], int, Dict[str, int], int]:
         """
-        Calculate all employee social security contributions.
+        Calculate employee and employer contributions in a single pass.
 
         Returns:
-            Dictionary with contribution categories and amounts
+            Tuple of (employee_contributions, employee_total,
+            employer_contributions, employer_total), amounts in cents
+        """
+        contributions = ({}, {})
+        totals = [0, 0]
+
+        # CCSS (Social Security, employer pays all) and C.A.R. (Retirement)
+        for side, category, base_bp, rate_bp, ceiling in cls._RATE_TABLES[employee_type]:
+            amount = cls._calculate_contribution(rate_bp, gross_cents * base_bp, ceiling)
+            contributions[side][category] = amount
+            totals[side] += amount
+
+        # CMRC (Supplementary Pension) - both portions from one tranche split
+        cmrc_employee, cmrc_employer = cls._calculate_cmrc_tranche(gross_cents)
+        employee_contrib, employer_contrib = contributions
+        employee_contrib['cmrc_supplementary_pension'] = cmrc_employee
+        employer_contrib['cmrc_supplementary_pension'] = cmrc_employer
+
+        return (employee_contrib, totals[cls._EMPLOYEE] + cmrc_employee,
+                employer_contrib, totals[cls._EMPLOYER] + cmrc_employer)
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _calculate_cached(cls, gross_cents: int, employee_type: str) -> Tuple[Any, ...]:
         """
-        contributions = {}
+        Calculate the reportable payslip amounts for a salary, memoized.
+
+        The result only depends on the salary in cents and the employee type,
+        so payroll runs where many employees share a salary band reuse it.
 
-        # C.A.R. (Retirement) - Employee portion
-        car_base = min(self.gross_salary, self.CAR_MONTHLY_CEILING)
-        contributions['car_retirement'] = self._calculate_contribution(
-            self.CAR_EMPLOYEE_RATE, car_base
+        Returns:
+            Frozen tuple of (employee_contributions items, employee_total,
+            employee_rate_percent, net_salary, employer_contributions items,
+            employer_total, employer_rate_percent, total_employer_cost,
+            total_contributions, ccss_base_used), amounts in EUR
+        """
+        (employee_contrib, employee_total,
+         employer_contrib, employer_total) = cls._calculate_contributions_cents(gross_cents, employee_type)
+
+        # Amounts stay in cents until here; each field is converted exactly once
+        return (
+            tuple((k, _cents_to_float(v)) for k, v in employee_contrib.items()),
+            _cents_to_float(employee_total),
+            _percent_of(employee_total, gross_cents),
+            _cents_to_float(gross_cents - employee_total),
+            tuple((k, _cents_to_float(v)) for k, v in employer_contrib.items()),
+            _cents_to_float(employer_total),
+            _percent_of(employer_total, gross_cents),
+            _cents_to_float(gross_cents + employer_total),
+            _cents_to_float(employee_total + employer_total),
+            cls._ccss_base_scaled(gross_cents, employee_type) / (100 * cls._BP_SCALE),
         )
 
-        # CMRC (Supplementary Pension) - Employee portion
-        cmrc_employee, _ = self._calculate_cmrc_tranche(self.gross_salary)
-        contributions['cmrc_supplementary_pension'] = cmrc_employee
+    def calculate_employee_contributions(self) -> Tuple[Dict[str, Decimal], Decimal]:
+        """
+        Calculate all employee social security contributions.
 
-        contributions['total'] = sum(contributions.values())
-        return contributions
+        Returns:
+            Tuple of (dictionary with contribution categories and amounts, total)
+        """
+        employee_contrib, employee_total, _, _ = self._calculate_contributions_cents(
+            self._gross_cents, self.employee_type)
+        contributions = {k: _cents_to_decimal(v) for k, v in employee_contrib.items()}
+        return contributions, _cents_to_decimal(employee_total)
 
-    def calculate_employer_contributions(self) -> Dict[str, Decimal]:
+    def calculate_employer_contributions(self) -> Tuple[Dict[str, Decimal], Decimal]:
         """
         Calculate all employer social security contributions.
 
         Returns:
-            Dictionary with contribution categories and amounts
+            Tuple of (dictionary with contribution categories and amounts, total)
         """
-        contributions = {}
+        _, _, employer_contrib, employer_total = self._calculate_contributions_cents(
+            self._gross_cents, self.employee_type)
+        contributions = {k: _cents_to_decimal(v) for k, v in employer_contrib.items()}
+        return contributions, _cents_to_decimal(employer_total)
 
-        # CCSS (Social Security) - Employer pays all
-        ccss_base = self._get_ccss_base()
-        contributions['ccss_social_security'] = self._calculate_contribution(
-            self.CCSS_RATE, ccss_base
-        )
+    def calculate(self, include_timestamp: bool = True) -> Dict[str, Any]:
+        """
+        Calculate complete payslip with all contributions.
+
+        Args:
+            include_timestamp: Add 'calculation_date' to the result. Disable when
+                calculating in a loop and stamp the results once instead.
 
-        # C.A.R. (Retirement) - Employer portion
-        car_base = min(self.gross_salary, self.CAR_MONTHLY_CEILING)
-        contributions['car_retirement'] = self._calculate_contribution(
-            self.CAR_EMPLOYER_RATE, car_base
+        Returns:
+            Dictionary containing all payslip information
+        """
+        (employee_items, employee_total, employee_rate, net_salary,
+         employer_items, employer_total, employer_rate, total_employer_cost,
+         total_contributions, ccss_base_used) = self._calculate_cached(self._gross_cents, self.employee_type)
+
+        result = {
+            'gross_salary': float(self.gross_salary),
+            'employee_type': self.employee_type,
+            'rates_effective_date': self.RATES_EFFECTIVE_DATE,
+            # Fresh dicts per call so callers cannot alter the cached values
+            'employee_contributions': dict(employee_items),
+            'employee_total': employee_total,
+            'employee_rate_percent': employee_rate,
+            'net_salary': net_salary,
+            'employer_contributions': dict(employer_items),
+            'employer_total': employer_total,
+            'employer_rate_percent': employer_rate,
+            'total_employer_cost': total_employer_cost,
+            'total_contributions': total_contributions,
+            'ccss_base_used': ccss_base_used,
+        }
+
+        if include_timestamp:
+            result['calculation_date'] = datetime.now().isoformat()
+
+        return result
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _bulk_rate_arrays(cls) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Import NumPy and build the bulk-path rate arrays on first use.
+
+        Returns:
+            Tuple of (int64 rates in basis points for the columns of the bulk
+            base matrix, int64 CCSS base in basis points of gross indexed by
+            EMPLOYEE_TYPE_CODES)
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("Bulk payroll runs require NumPy. Install with: pip install numpy") from None
+
+        # Columns: CCSS, C.A.R. employee, C.A.R. employer, CMRC tranche A, CMRC tranche B
+        rates_bp = np.array([
+            cls._CCSS_RATE_BP,
+            cls._CAR_EMPLOYEE_RATE_BP,
+            cls._CAR_EMPLOYER_RATE_BP,
+            cls._CMRC_TRANCHE_A_RATE_BP,
+            cls._CMRC_TRANCHE_B_RATE_BP,
+        ], dtype=np.int64)
+
+        ccss_base_bp_by_code = np.empty(len(cls.EMPLOYEE_TYPE_CODES), dtype=np.int64)
+        ccss_base_bp_by_code[cls.EMPLOYEE_TYPE_CODES['standard']] = cls._BP_SCALE
+        ccss_base_bp_by_code[cls.EMPLOYEE_TYPE_CODES['household']] = cls._CCSS_HOUSEHOLD_BASE_BP
+
+        # Returned arrays are shared between calls
+        rates_bp.flags.writeable = False
+        ccss_base_bp_by_code.flags.writeable = False
+        return rates_bp, ccss_base_bp_by_code
+
+    @classmethod
+    def calculate_batch(cls, gross_salaries: Sequence[float], employee_type: str = 'household',
+                        include_timestamp: bool = True) -> List[Dict[str, Any]]:
+        """
+        Calculate payslips for many salaries at once (vectorized with NumPy).
+
+        Contribution bases are stacked into an (N, 5) int64 matrix and multiplied
+        by a fixed basis-point rate vector in one broadcast operation instead of
+        running the per-salary path once per salary. The integer cent arithmetic
+        gives the same amounts as calculate().
+
+        Args:
+            gross_salaries: Monthly gross salaries in EUR (at most two decimals)
+            employee_type: 'household' (gens de maison) or 'standard'
+            include_timestamp: Add 'calculation_date' (captured once for the
+                whole batch) to each result
+
+        Returns:
+            List of result dictionaries with the same layout as calculate()
+
+        Raises:
+            ValueError: If a salary is not finite or not a whole number of cents,
+                or employee_type is unknown
+        """
+        employee_type = employee_type.lower()
+        if employee_type not in cls._RATE_TABLES:
+            raise ValueError("employee_type must be 'household' or 'standard'")
+
+        gross, gross_cents = cls._gross_cents_array(gross_salaries)
+        ccss_base_bp = cls._CCSS_HOUSEHOLD_BASE_BP if employee_type == 'household' else cls._BP_SCALE
+
+        (ccss_base, ccss, car_employee, cmrc_employee,
+         car_employer, cmrc_employer) = cls._batch_contribution_cents(gross_cents, ccss_base_bp)
+
+        employee_total = car_employee + cmrc_employee
+        employer_total = ccss + car_employer + cmrc_employer
+        net_salary = gross_cents - employee_total
+        total_employer_cost = gross_cents + employer_total
+        total_contributions = employee_total + employer_total
+
+        employee_rate = _percent_of_array(employee_total, gross_cents)
+        employer_rate = _percent_of_array(employer_total, gross_cents)
+
+        calculation_date = datetime.now().isoformat() if include_timestamp else None
+
+        # Zip the columns back into per-salary dictionaries (EUR floats) only at the boundary
+        columns = zip(
+            gross.tolist(), (car_employee / 100).tolist(), (cmrc_employee / 100).tolist(),
+            (employee_total / 100).tolist(), employee_rate.tolist(), (net_salary / 100).tolist(),
+            (ccss / 100).tolist(), (car_employer / 100).tolist(), (cmrc_employer / 100).tolist(),
+            (employer_total / 100).tolist(), employer_rate.tolist(), (total_employer_cost / 100).tolist(),
+            (total_contributions / 100).tolist(), (ccss_base / (100 * cls._BP_SCALE)).tolist(),
         )
+        results = []
+        for (g, car_emp, cmrc_emp, emp_total, emp_rate, net, ccss_er, car_er, cmrc_er,
+             er_total, er_rate, cost, total, ccss_base_used) in columns:
+            result = {
+                'gross_salary': g,
+                'employee_type': employee_type,
+                'rates_effective_date': cls.RATES_EFFECTIVE_DATE,
+                'employee_contributions': {
+                    'car_retirement': car_emp,
+                    'cmrc_supplementary_pension': cmrc_emp,
+                },
+                'employee_total': emp_total,
+                'employee_rate_percent': emp_rate,
+                'net_salary': net,
+                'employer_contributions': {
+                    'ccss_social_security': ccss_er,
+                    'car_retirement': car_er,
+                    'cmrc_supplementary_pension': cmrc_er,
+                },
+                'employer_total': er_total,
+                'employer_rate_percent': er_rate,
+                'total_employer_cost': cost,
+                'total_contributions': total,
+                'ccss_base_used': ccss_base_used,
+            }
+            if calculation_date is not None:
+                result['calculation_date'] = calculation_date
+            results.append(result)
+
+        return results
+
+    @classmethod
+    def calculate_many(cls, gross_salaries: Sequence[float],
+                       employee_types: Union[int, str, Sequence[Union[int, str]]] = EMPLOYEE_TYPE_CODES['household'],
+                       ) -> 'np.recarray':
+        """
+        Calculate a payroll run for many employees of mixed types (vectorized with NumPy).
 
-        # CMRC (Supplementary Pension) - Employer portion
-        _, cmrc_employer = self._calculate_cmrc_tranche(self.gross_salary)
-        contributions['cmrc_supplementary_pension'] = cmrc_employer
+        Unlike calculate_batch(), no per-employee dictionaries are built: the
+        result is a record array with one contiguous column per field, suited
+        to aggregating a whole payroll (e.g. result.employer_cost.sum()).
 
-        contributions['total'] = sum(contributions.values())
-        return contributions
+        Args:
+            gross_salaries: Monthly gross salaries in EUR (at most two decimals),
+                or a single salary
+            employee_types: Employee type per salary, or a single one for all of
+                them, as an integer code (see EMPLOYEE_TYPE_CODES: 0=standard,
+                1=household) or a type name ('household' or 'standard')
 
-    def calculate(self) -> Dict[str, Any]:
+        Returns:
+            Record array with float64 fields gross, net, employer_cost,
+            emp_total and er_total (EUR)
+
+        Raises:
+            ValueError: If a salary is not finite or not a whole number of cents,
+                an employee type is unknown, or employee_types is neither a single
+                type nor one type per salary
         """
-        Calculate complete payslip with all contributions.
+        _, ccss_base_bp_by_code = cls._bulk_rate_arrays()
+        import numpy as np
+
+        error = ("employee_types must be 'household'/'standard' or codes from "
+                 "EMPLOYEE_TYPE_CODES (0=standard, 1=household), one per salary or a single one")
+        gross, gross_cents = cls._gross_cents_array(np.atleast_1d(gross_salaries))
+        types = np.asarray(employee_types)
+
+        # Map type names to codes
+        if types.dtype.kind in 'USO':
+            try:
+                types = np.array([cls.EMPLOYEE_TYPE_CODES[str(t).lower()] if isinstance(t, str) else t
+                                  for t in types.ravel().tolist()]).reshape(types.shape)
+            except KeyError:
+                raise ValueError(error) from None
+
+        # Reject non-integer codes (floats, bools) rather than truncating them
+        if types.size == 0:
+            types = types.astype(np.int64)
+        elif types.dtype.kind not in 'iu':
+            raise ValueError(error)
+        try:
+            type_idx = np.broadcast_to(types, gross.shape)
+        except ValueError:
+            raise ValueError(error) from None
+        if type_idx.size and (type_idx.min() < 0 or type_idx.max() >= len(ccss_base_bp_by_code)):
+            raise ValueError(error)
+
+        # Only the CCSS base differs between employee types
+        (_, ccss, car_employee, cmrc_employee,
+         car_employer, cmrc_employer) = cls._batch_contribution_cents(gross_cents, ccss_base_bp_by_code[type_idx])
+
+        employee_total = car_employee + cmrc_employee
+        employer_total = ccss + car_employer + cmrc_employer
+
+        return np.rec.fromarrays(
+            [gross, (gross_cents - employee_total) / 100, (gross_cents + employer_total) / 100,
+             employee_total / 100, employer_total / 100],
+            names='gross,net,employer_cost,emp_total,er_total',
+        )
+
+    @classmethod
+    def _gross_cents_array(cls, gross_salaries: Sequence[float]) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Convert gross salaries to int64 cents with the same rule as __init__.
+
+        Args:
+            gross_salaries: Monthly gross salaries in EUR
 
         Returns:
-            Dictionary containing all payslip information
+            Tuple of (float64 gross salaries, int64 gross salaries in cents)
+
+        Raises:
+            ValueError: If any salary is not finite or not a whole number of cents
         """
-        employee_contrib = self.calculate_employee_contributions()
-        employer_contrib = self.calculate_employer_contributions()
+        cls._bulk_rate_arrays()
+        import numpy as np
 
-        # Calculate net salary
-        net_salary = self.gross_salary - employee_contrib['total']
+        gross = np.asarray(gross_salaries, dtype=np.float64)
+        gross_cents = np.round(gross * 100)
 
-        # Calculate total employer cost
-        total_employer_cost = self.gross_salary + employer_contrib['total']
+        # A float has at most two decimals exactly when it is the float nearest to its cents / 100
+        if not np.isfinite(gross).all() or (gross_cents / 100 != gross).any():
+            raise ValueError("gross_salaries must be finite amounts in whole cents (at most two decimals)")
+        return gross, gross_cents.astype(np.int64)
 
-        # Calculate total contributions
-        total_contributions = employee_contrib['total'] + employer_contrib['total']
+    @classmethod
+    def _batch_contribution_cents(cls, gross_cents: 'np.ndarray', ccss_base_bp: Any) -> Tuple['np.ndarray', ...]:
+        """
+        Vectorized contribution kernel shared by calculate_batch and calculate_many.
 
-        # Calculate percentages
-        employee_rate = (employee_contrib['total'] / self.gross_salary * 100) if self.gross_salary > 0 else Decimal('0')
-        employer_rate = (employer_contrib['total'] / self.gross_salary * 100) if self.gross_salary > 0 else Decimal('0')
+        Args:
+            gross_cents: int64 array of gross salaries in cents
+            ccss_base_bp: CCSS base in basis points of gross (scalar or per-salary array)
 
-        result = {
-            'gross_salary': float(self.gross_salary),
-            'employee_type': self.employee_type,
-            'rates_effective_date': self.RATES_EFFECTIVE_DATE,
-            'employee_contributions': {k: float(v) for k, v in employee_contrib.items()},
-            'employee_total': float(employee_contrib['total']),
-            'employee_rate_percent': float(employee_rate.quantize(Decimal('0.01'))),
-            'net_salary': float(net_salary),
-            'employer_contributions': {k: float(v) for k, v in employer_contrib.items()},
-            'employer_total': float(employer_contrib['total']),
-            'employer_rate_percent': float(employer_rate.quantize(Decimal('0.01'))),
-            'total_employer_cost': float(total_employer_cost),
-            'total_contributions': float(total_contributions),
-            'calculation_date': datetime.now().isoformat(),
-            'ccss_base_used': float(self._get_ccss_base()),
-        }
+        Returns:
+            Tuple of int64 arrays: (ccss_base in cents * _BP_SCALE, ccss,
+            car_employee, cmrc_employee, car_employer, cmrc_employer) in cents
+        """
+        rates_bp, _ = cls._bulk_rate_arrays()
+        import numpy as np
 
-        return result
+        scale = cls._BP_SCALE
+
+        # Contribution bases in cents * _BP_SCALE, one column per entry of rates_bp
+        ccss_base = np.minimum(gross_cents * ccss_base_bp, cls._CCSS_CEILING_CENTS * scale)
+        car_base = np.minimum(gross_cents, cls._CAR_CEILING_CENTS) * scale
+        tranche_a_base = np.clip(gross_cents, 0, cls._CMRC_TRANCHE_A_CEILING_CENTS) * scale
+        tranche_b_base = np.clip(gross_cents - cls._CMRC_TRANCHE_A_CEILING_CENTS, 0,
+                                 cls._CMRC_TRANCHE_B_SPAN_CENTS) * scale
+        bases = np.column_stack((ccss_base, car_base, car_base, tranche_a_base, tranche_b_base))
+
+        contribs = _round_half_up_div_array(bases * rates_bp, cls._CONTRIBUTION_DIVISOR)
+        ccss, car_employee, car_employer, tranche_a, tranche_b = contribs.T
+
+        # CMRC tranche totals are split between employee and employer
+        cmrc_employee = _round_half_up_div_array(
+            tranche_a * cls._CMRC_TRANCHE_A_EMPLOYEE_SHARE_BP
+            + tranche_b * cls._CMRC_TRANCHE_B_EMPLOYEE_SHARE_BP, scale)
+        cmrc_employer = _round_half_up_div_array(
+            tranche_a * cls._CMRC_TRANCHE_A_EMPLOYER_SHARE_BP
+            + tranche_b * cls._CMRC_TRANCHE_B_EMPLOYER_SHARE_BP, scale)
+
+        return ccss_base, ccss, car_employee, cmrc_employee, car_employer, cmrc_employer
 
 
 def format_payslip_text(result: Dict[str, Any]) -> str:
@@ -259,85 +686,72 @@ def format_payslip_text(result: Dict[str, Any]) -> str:
     Returns:
         Formatted text representation
     """
-    lines = []
-    lines.append("=" * 70)
-    lines.append("BULLETIN DE SALAIRE - PRINCIPAUTÉ DE MONACO")
-    lines.append("=" * 70)
-    lines.append(f"Type d'employé: {result['employee_type'].upper()}")
-    lines.append(f"Date de calcul: {result['calculation_date'][:10]}")
-    lines.append(f"Taux en vigueur au: {result['rates_effective_date']}")
-    lines.append("")
-
-    # Employee section
-    lines.append("-" * 70)
-    lines.append("SALAIRE ET COTISATIONS SALARIALES")
-    lines.append("-" * 70)
-    lines.append(f"Salaire brut mensuel:              {result['gross_salary']:>15.2f} €")
-    lines.append("")
-    lines.append("Cotisations salariales:")
-
-    contrib_labels = {
-        'car_retirement': 'C.A.R. - Retraite (6,85%)',
-        'cmrc_supplementary_pension': 'CMRC - Retraite complémentaire',
-    }
-
-    for category, amount in result['employee_contributions'].items():
-        if category != 'total':
-            label = contrib_labels.get(category, category.replace('_', ' ').title())
-            lines.append(f"  - {label:<38} {amount:>15.2f} €")
-
-    lines.append(f"  {'Total cotisations salariales':<38} {result['employee_total']:>15.2f} €")
-    lines.append(f"  {'Taux effectif':<38} {result['employee_rate_percent']:>14.2f} %")
-    lines.append("")
-    lines.append(f"{'SALAIRE NET À PAYER:':<40} {result['net_salary']:>15.2f} €")
-    lines.append("")
-
-    # Employer section
-    lines.append("-" * 70)
-    lines.append("COTISATIONS PATRONALES")
-    lines.append("-" * 70)
-
-    employer_labels = {
-        'ccss_social_security': f'CCSS - Sécurité sociale (13,40%) *',
-        'car_retirement': 'C.A.R. - Retraite (8,33%)',
-        'cmrc_supplementary_pension': 'CMRC - Retraite complémentaire',
-    }
+    # Variable-length parts are built first, then interpolated into one template
+    employee_lines = "\n".join(
+        f"  - {_EMPLOYEE_LABELS[category]:<38} {amount:>15.2f} €"
+        for category, amount in result['employee_contributions'].items()
+    )
+    employer_lines = "\n".join(
+        f"  - {_EMPLOYER_LABELS[category]:<38} {amount:>15.2f} €"
+        for category, amount in result['employer_contributions'].items()
+    )
 
-    for category, amount in result['employer_contributions'].items():
-        if category != 'total':
-            label = employer_labels.get(category, category.replace('_', ' ').title())
-            lines.append(f"  - {label:<38} {amount:>15.2f} €")
-
-    lines.append(f"  {'Total cotisations patronales':<38} {result['employer_total']:>15.2f} €")
-    lines.append(f"  {'Taux effectif':<38} {result['employer_rate_percent']:>14.2f} %")
-    lines.append("")
-    lines.append(f"{'COÛT TOTAL EMPLOYEUR:':<40} {result['total_employer_cost']:>15.2f} €")
-    lines.append("")
-
-    # Summary
-    lines.append("-" * 70)
-    lines.append("RÉSUMÉ")
-    lines.append("-" * 70)
-    lines.append(f"Salaire brut:                      {result['gross_salary']:>15.2f} €")
-    lines.append(f"Cotisations totales:               {result['total_contributions']:>15.2f} €")
-    lines.append(f"  - Part salariale:                {result['employee_total']:>15.2f} €")
-    lines.append(f"  - Part patronale:                {result['employer_total']:>15.2f} €")
-    lines.append(f"Salaire net:                       {result['net_salary']:>15.2f} €")
-    lines.append(f"Coût total employeur:              {result['total_employer_cost']:>15.2f} €")
-    lines.append("=" * 70)
-    lines.append("")
+    date_line = ""
+    if 'calculation_date' in result:
+        date_line = f"Date de calcul: {result['calculation_date'][:10]}\n"
 
     # Add note about CCSS base for household employees
+    ccss_note = ""
     if result['employee_type'] == 'household':
-        lines.append("* CCSS: Pour les employés de maison (1-2 employés, <254h/mois),")
-        lines.append(f"  la base de cotisation = 33% du salaire brut = {result['ccss_base_used']:.2f} €")
-        lines.append("")
-
-    lines.append("Taux officiels en vigueur au 1er octobre 2025")
-    lines.append("Source: Caisses Sociales de Monaco - www.caisses-sociales.mc")
-    lines.append("")
+        ccss_note = (
+            "* CCSS: Pour les employés de maison (1-2 employés, <254h/mois),\n"
+            f"  la base de cotisation = 33% du salaire brut = {result['ccss_base_used']:.2f} €\n\n"
+        )
 
-    return "\n".join(lines)
+    rule = "=" * 70
+    separator = "-" * 70
+
+    return f"""{rule}
+BULLETIN DE SALAIRE - PRINCIPAUTÉ DE MONACO
+{rule}
+Type d'employé: {result['employee_type'].upper()}
+{date_line}Taux en vigueur au: {result['rates_effective_date']}
+
+{separator}
+SALAIRE ET COTISATIONS SALARIALES
+{separator}
+Salaire brut mensuel:              {result['gross_salary']:>15.2f} €
+
+Cotisations salariales:
+{employee_lines}
+  {'Total cotisations salariales':<38} {result['employee_total']:>15.2f} €
+  {'Taux effectif':<38} {result['employee_rate_percent']:>14.2f} %
+
+{'SALAIRE NET À PAYER:':<40} {result['net_salary']:>15.2f} €
+
+{separator}
+COTISATIONS PATRONALES
+{separator}
+{employer_lines}
+  {'Total cotisations patronales':<38} {result['employer_total']:>15.2f} €
+  {'Taux effectif':<38} {result['employer_rate_percent']:>14.2f} %
+
+{'COÛT TOTAL EMPLOYEUR:':<40} {result['total_employer_cost']:>15.2f} €
+
+{separator}
+RÉSUMÉ
+{separator}
+Salaire brut:                      {result['gross_salary']:>15.2f} €
+Cotisations totales:               {result['total_contributions']:>15.2f} €
+  - Part salariale:                {result['employee_total']:>15.2f} €
+  - Part patronale:                {result['employer_total']:>15.2f} €
+Salaire net:                       {result['net_salary']:>15.2f} €
+Coût total employeur:              {result['total_employer_cost']:>15.2f} €
+{rule}
+
+{ccss_note}Taux officiels en vigueur au 1er octobre 2025
+Source: Caisses Sociales de Monaco - www.caisses-sociales.mc
+"""
 
 
 def main():
@@ -372,11 +786,14 @@ def main():
     args = parser.parse_args()
 
     # Create calculator and compute
-    calculator = MonacoPayslipCalculator(
-        gross_salary=args.gross_salary,
-        employee_type=args.employee_type,
-        monthly_hours=args.monthly_hours
-    )
+    try:
+        calculator = MonacoPayslipCalculator(
+            gross_salary=args.gross_salary,
+            employee_type=args.employee_type,
+            monthly_hours=args.monthly_hours
+        )
+    except ValueError as e:
+        parser.error(str(e))
 
     result = calculator.calculate()
 
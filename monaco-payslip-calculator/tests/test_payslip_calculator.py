@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Monaco payslip calculator
+Checks single-payslip calculate() and that the NumPy bulk paths agree with it
+"""
+
+import importlib.util
+import os
+import sys
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+# Add scripts directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+from payslip_calculator import MonacoPayslipCalculator, format_payslip_text
+
+NUMPY_INSTALLED = importlib.util.find_spec('numpy') is not None
+
+# Salaries where float rounding of the effective rates used to disagree with calculate()
+RATE_EDGE_CASES = [
+    (23200.00, 'household'),
+    (10938.88, 'standard'),
+    (40.00, 'household'),
+]
+
+
+class TestCalculate(unittest.TestCase):
+    """Test single-payslip calculation"""
+
+    def test_sub_cent_gross_rejected(self):
+        """Test gross salaries that are not whole cents are rejected instead of rounded"""
+        for gross in (3500.005, 0.125, float('nan'), float('inf')):
+            with self.subTest(gross=gross):
+                with self.assertRaises(ValueError):
+                    MonacoPayslipCalculator(gross)
+
+    def test_totals_add_up(self):
+        """Test net salary and employer cost reconcile with the reported gross"""
+        result = MonacoPayslipCalculator(3500.10).calculate(include_timestamp=False)
+        self.assertAlmostEqual(result['net_salary'] + result['employee_total'], result['gross_salary'], places=9)
+        self.assertAlmostEqual(result['total_employer_cost'] - result['employer_total'], result['gross_salary'], places=9)
+
+    def test_without_timestamp(self):
+        """Test include_timestamp=False omits calculation_date and the payslip date line"""
+        result = MonacoPayslipCalculator(3500).calculate(include_timestamp=False)
+        self.assertNotIn('calculation_date', result)
+        self.assertNotIn('Date de calcul', format_payslip_text(result))
+
+    def test_with_timestamp(self):
+        """Test calculation_date is included by default and printed on the payslip"""
+        result = MonacoPayslipCalculator(3500).calculate()
+        self.assertIn('calculation_date', result)
+        self.assertIn(f"Date de calcul: {result['calculation_date'][:10]}", format_payslip_text(result))
+
+    def test_contributions_return_items_and_total(self):
+        """Test the contribution methods return (categories, total) with the total kept out of the dict"""
+        calculator = MonacoPayslipCalculator(3500)
+        employee_contrib, employee_total = calculator.calculate_employee_contributions()
+        employer_contrib, employer_total = calculator.calculate_employer_contributions()
+
+        self.assertEqual(employee_contrib, {
+            'car_retirement': Decimal('239.75'),
+            'cmrc_supplementary_pension': Decimal('140.28'),
+        })
+        self.assertEqual(employee_total, Decimal('380.03'))
+        self.assertEqual(employer_contrib, {
+            'ccss_social_security': Decimal('154.77'),
+            'car_retirement': Decimal('291.55'),
+            'cmrc_supplementary_pension': Decimal('210.42'),
+        })
+        self.assertEqual(employer_total, Decimal('656.74'))
+
+        result = calculator.calculate(include_timestamp=False)
+        self.assertEqual(float(employee_total), result['employee_total'])
+        self.assertEqual(float(employer_total), result['employer_total'])
+
+
+class TestCalculateCache(unittest.TestCase):
+    """Test memoization of calculate() results"""
+
+    def setUp(self):
+        MonacoPayslipCalculator._calculate_cached.cache_clear()
+
+    def test_repeated_salary_is_cache_hit(self):
+        """Test a salary and type seen before is served from the cache"""
+        MonacoPayslipCalculator(3500).calculate()
+        MonacoPayslipCalculator(3500).calculate()
+        MonacoPayslipCalculator(3500, 'standard').calculate()
+        info = MonacoPayslipCalculator._calculate_cached.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 2))
+
+    def test_mutating_result_does_not_leak(self):
+        """Test changing a returned result leaves the next result untouched"""
+        expected = MonacoPayslipCalculator(3500).calculate(include_timestamp=False)
+        result = MonacoPayslipCalculator(3500).calculate(include_timestamp=False)
+        result['employee_contributions']['car_retirement'] = 0.0
+        result['employer_contributions'].clear()
+        self.assertEqual(MonacoPayslipCalculator(3500).calculate(include_timestamp=False), expected)
+
+    def test_timestamp_not_cached(self):
+        """Test calculation_date is taken at call time even on a cache hit"""
+        MonacoPayslipCalculator(3500).calculate()
+        with mock.patch('payslip_calculator.datetime') as mock_datetime:
+            mock_datetime.now.return_value.isoformat.return_value = '2026-01-31T12:00:00'
+            result = MonacoPayslipCalculator(3500).calculate()
+        self.assertEqual(MonacoPayslipCalculator._calculate_cached.cache_info().hits, 1)
+        self.assertEqual(result['calculation_date'], '2026-01-31T12:00:00')
+
+
+@unittest.skipUnless(NUMPY_INSTALLED, "numpy not installed")
+class TestCalculateBatch(unittest.TestCase):
+    """Test calculate_batch against calculate()"""
+
+    def test_effective_rates_match_calculate(self):
+        """Test batch effective rates use the same half-even rounding as calculate()"""
+        for gross, employee_type in RATE_EDGE_CASES:
+            with self.subTest(gross=gross, employee_type=employee_type):
+                expected = MonacoPayslipCalculator(gross, employee_type).calculate(include_timestamp=False)
+                result, = MonacoPayslipCalculator.calculate_batch(
+                    [gross], employee_type, include_timestamp=False)
+                self.assertEqual(result, expected)
+
+    def test_results_match_calculate(self):
+        """Test batch results are identical to calculate() across salary bands"""
+        salaries = [0, 0.01, 2500, 3500, 3971, 3971.01, 5000, 6112, 9800, 29697, 31768, 40000]
+        for employee_type in ('household', 'standard'):
+            results = MonacoPayslipCalculator.calculate_batch(
+                salaries, employee_type, include_timestamp=False)
+            for gross, result in zip(salaries, results):
+                with self.subTest(gross=gross, employee_type=employee_type):
+                    expected = MonacoPayslipCalculator(gross, employee_type).calculate(include_timestamp=False)
+                    self.assertEqual(result, expected)
+
+    def test_invalid_gross_raise(self):
+        """Test bulk paths reject the same sub-cent and non-finite salaries as calculate()"""
+        for gross in (1.005, 0.125, 3500.005, float('nan'), float('inf')):
+            with self.subTest(gross=gross):
+                with self.assertRaises(ValueError):
+                    MonacoPayslipCalculator.calculate_batch([2500, gross])
+                with self.assertRaises(ValueError):
+                    MonacoPayslipCalculator.calculate_many([2500, gross])
+
+
+@unittest.skipUnless(NUMPY_INSTALLED, "numpy not installed")
+class TestCalculateMany(unittest.TestCase):
+    """Test calculate_many employee type handling"""
+
+    def test_type_names_match_codes(self):
+        """Test type names and EMPLOYEE_TYPE_CODES give the same payroll"""
+        salaries = [3500, 5000]
+        codes = MonacoPayslipCalculator.EMPLOYEE_TYPE_CODES
+        by_name = MonacoPayslipCalculator.calculate_many(salaries, ['household', 'standard'])
+        by_code = MonacoPayslipCalculator.calculate_many(salaries, [codes['household'], codes['standard']])
+        self.assertEqual(by_name.tolist(), by_code.tolist())
+        self.assertEqual(by_name.net.tolist(), [3119.97, 4398.37])
+
+    def test_default_type_is_household(self):
+        """Test the default employee type matches the class default"""
+        result = MonacoPayslipCalculator.calculate_many([3500])
+        expected = MonacoPayslipCalculator(3500).calculate(include_timestamp=False)
+        self.assertEqual(result.net.tolist(), [expected['net_salary']])
+
+    def test_single_salary(self):
+        """Test a scalar salary is treated as a one-employee payroll"""
+        result = MonacoPayslipCalculator.calculate_many(3500, 'standard')
+        self.assertEqual(result.net.tolist(), [3119.97])
+
+    def test_invalid_types_raise(self):
+        """Test non-integer codes, unknown names and wrong-length types are rejected"""
+        for employee_types in ([0.7], ['nope'], [True], [2], [-1], ['household'] * 2):
+            with self.subTest(employee_types=employee_types):
+                with self.assertRaises(ValueError):
+                    MonacoPayslipCalculator.calculate_many([3500], employee_types)
+
+
+if __name__ == '__main__':
+    unittest.main()